@@ -0,0 +1,89 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test the table-driven value engine against the rule-based one.
+"""
+from itertools import product
+from unittest import TestCase
+
+from text_to_num import alpha2digit, text2num
+from text_to_num.lang import LANG
+from text_to_num.parsers import WordStreamValueParser, WordStreamValueParserFSM
+
+
+class TestEngines(TestCase):
+    def test_group_expects(self):
+        for code, language in LANG.items():
+            words = list(language.NUMBERS) + ["cat"]
+            rules = WordStreamValueParser(language)
+            table = WordStreamValueParserFSM(language)
+            for last_word, word, grp_val in product(words, words, range(0, 30, 3)):
+                with self.subTest(lang=code, last_word=last_word, word=word, grp_val=grp_val):
+                    for parser in (rules, table):
+                        parser.last_word = None
+                        parser.group_expects(last_word)
+                        parser.grp_val = grp_val
+                    self.assertEqual(
+                        table.group_expects(word, update=False),
+                        rules.group_expects(word, update=False),
+                    )
+
+    def test_text2num(self):
+        cases = [
+            ("fr", "quatre-vingt dix-sept mille trois cent vingt-et-un"),
+            ("fr", "quatre vingt sept"),
+            ("en", "nine hundred ninety nine thousand two hundred"),
+            ("en", "twenty seven hundred"),
+            ("es", "mil novecientos noventa y nueve"),
+            ("pt", "dois mil e vinte e três"),
+            ("ca", "mil nou-cents vuitanta-quatre"),
+            ("ru", "сто двадцать пять тысяч"),
+        ]
+        for code, text in cases:
+            for relaxed in (False, True):
+                with self.subTest(lang=code, text=text, relaxed=relaxed):
+                    try:
+                        expected = text2num(text, code, relaxed=relaxed)
+                    except ValueError:
+                        with self.assertRaises(ValueError):
+                            text2num(text, code, relaxed=relaxed, engine="table")
+                    else:
+                        self.assertEqual(
+                            text2num(text, code, relaxed=relaxed, engine="table"), expected
+                        )
+
+    def test_alpha2digit(self):
+        source = "twenty one thousand five hundred, thirty two twelve and eleven point five"
+        self.assertEqual(
+            alpha2digit(source, "en", engine="table"), alpha2digit(source, "en")
+        )
+        source = "vingt et un mille, dix-neuf cent quatre-vingt quatre"
+        self.assertEqual(
+            alpha2digit(source, "fr", engine="table"), alpha2digit(source, "fr")
+        )
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            text2num("one", "en", engine="nope")
+        with self.assertRaises(ValueError):
+            alpha2digit("one", "en", engine="nope")
@@ -0,0 +1,51 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+"""
+Test the compiled language tables.
+"""
+from unittest import TestCase
+
+from text_to_num.lang import LANG
+from text_to_num.lang.base import IS_MULTIPLIER, IS_NUMBER, IS_SIGN, IS_ZERO
+
+
+class TestLexicon(TestCase):
+    def test_numbers(self):
+        for code, language in LANG.items():
+            for word, value in language.NUMBERS.items():
+                with self.subTest(lang=code, word=word):
+                    flags, lex_value = language.lexicon[word]
+                    self.assertTrue(flags & IS_NUMBER)
+                    self.assertEqual(lex_value, value)
+                    self.assertEqual(bool(flags & IS_MULTIPLIER), word in language.MULTIPLIERS)
+
+    def test_other_words(self):
+        for code, language in LANG.items():
+            with self.subTest(lang=code):
+                for word in language.ZERO:
+                    self.assertTrue(language.lexicon[word].flags & IS_ZERO)
+                for word in language.SIGN:
+                    self.assertTrue(language.lexicon[word].flags & IS_SIGN)
+                self.assertNotIn("cat", language.lexicon)
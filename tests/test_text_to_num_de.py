@@ -26,6 +26,8 @@ Test the ``text_to_num`` library.
 """
 from unittest import TestCase
 from text_to_num import alpha2digit, text2num
+from text_to_num.lang import LANG
+from text_to_num.parsers import WordStreamValueParserGerman
 
 # TODO: we need to improve tests to use 'relaxed=True' explicitly.
 # without 'relaxed' some things should fail, e.g.: text2num("ein und zwanzig", "de")
@@ -84,6 +86,23 @@ class TestTextToNumDE(TestCase):
         self.assertRaises(ValueError, text2num, "fünfzignullzwei", "de")
         self.assertRaises(ValueError, text2num, "fünfzigdreinull", "de")
 
+    def test_push(self):
+        parser = WordStreamValueParserGerman(LANG["de"])
+        self.assertTrue(parser.push("zwei"))
+        self.assertEqual(parser.value, 2)
+        self.assertFalse(parser.push("und"))
+        self.assertTrue(parser.push("vierzigtausend"))
+        self.assertEqual(parser.value, 42_000)
+        self.assertTrue(parser.push("dreihundert"))
+        self.assertEqual(parser.value, 42_300)
+        self.assertFalse(parser.push("Katze"))
+        self.assertFalse(parser.push("vier"))
+
+    def test_alpha2digit_invalid_and(self):
+        source = "milliarde trilliarden milliarde und billion"
+        expected = "1000000000 1000000000001000000000 und 1000000000000"
+        self.assertEqual(alpha2digit(source, "de"), expected)
+
     def test_text2num_hundred_addition(self):
         self.assertRaises(ValueError, text2num, "achtundachtzig dreihundert", "de")
         self.assertRaises(ValueError, text2num, "zwanzig dreihundert", "de")
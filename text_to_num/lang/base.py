@@ -24,7 +24,31 @@
 Base type for language objects.
 """
 
-from typing import Dict, Optional, Set, Tuple
+from typing import Dict, NamedTuple, Optional, Set, Tuple
+
+# Word classes of the compiled lexicon (bit flags)
+IS_NUMBER = 1
+IS_MULTIPLIER = 2
+IS_UNIT = 4
+IS_STEN = 8
+IS_MTEN = 16
+IS_MTEN_WSTEN = 32
+IS_HUNDRED = 64
+IS_MHUNDRED = 128
+IS_ZERO = 256
+IS_SIGN = 512
+IS_DECIMAL_SEP = 1024
+IS_AND_NUM = 2048
+
+
+class WordInfo(NamedTuple):
+    """Compiled lexicon record of a word."""
+
+    flags: int  # the word classes (``IS_*`` bit flags)
+    value: int  # the numeric value of number words, else 0
+
+
+UNKNOWN_WORD = WordInfo(0, 0)
 
 
 class Language:
@@ -34,7 +58,7 @@ class Language:
     UNITS: Dict[str, int]
     STENS: Dict[str, int]
     MTENS: Dict[str, int]
-    MTENS_WSTENS: Set[str]
+    MTENS_WSTENS: Set[str] = set()
     HUNDRED: Dict[str, int]
     MHUNDREDS: Dict[str, int] = {}
     NUMBERS: Dict[str, int]
@@ -44,16 +68,45 @@ class Language:
     DECIMAL_SEP: str
     DECIMAL_SYM: str
 
-    AND_NUMS: Set[str]
+    AND_NUMS: Set[str] = set()
     AND: str
     NEVER_IF_ALONE: Set[str]
 
     # Relaxed composed numbers (two-words only)
     # start => (next, target)
-    RELAXED: Dict[str, Tuple[str, str]]
+    RELAXED: Dict[str, Tuple[str, str]] = {}
 
     simplify_check_coef_appliable: bool = False
 
+    def __init__(self) -> None:
+        # word -> WordInfo, so that the parsers classify a word with a single lookup.
+        self.lexicon: Dict[str, WordInfo] = self.compile_lexicon()
+
+    def compile_lexicon(self) -> Dict[str, WordInfo]:
+        """Gather the word classes and values of the vocabulary into a single mapping."""
+        flags: Dict[str, int] = {}
+        values: Dict[str, int] = {}
+        for words, flag in (
+            (self.NUMBERS, IS_NUMBER),
+            (self.MULTIPLIERS, IS_MULTIPLIER),
+            (self.UNITS, IS_UNIT),
+            (self.STENS, IS_STEN),
+            (self.MTENS, IS_MTEN),
+            (self.MTENS_WSTENS, IS_MTEN_WSTEN),
+            (self.HUNDRED, IS_HUNDRED),
+            (self.MHUNDREDS, IS_MHUNDRED),
+            (self.ZERO, IS_ZERO),
+            (self.SIGN, IS_SIGN),
+            ({self.DECIMAL_SEP, *self.DECIMAL_SEP.split(",")}, IS_DECIMAL_SEP),
+            (self.AND_NUMS, IS_AND_NUM),
+        ):
+            for word in words:
+                flags[word] = flags.get(word, 0) | flag
+        # The parsers look for multipliers first, then hundreds
+        for numbers in (self.NUMBERS, self.MHUNDREDS, self.HUNDRED, self.MULTIPLIERS):
+            values.update(numbers)
+        return {word: WordInfo(flag, values.get(word, 0)) for word, flag in flags.items()}
+
     def ord2card(self, word: str) -> Optional[str]:
         """Convert ordinal number to cardinal.
 
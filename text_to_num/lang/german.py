@@ -20,7 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 import re
 
 from .base import Language
@@ -105,6 +105,15 @@ ALL_WORDS_SORTED_REVERSE = dict(sorted(
     reverse=True
 ))
 
+# Character trie of all number words for the longest match segmentation of compound words.
+# Each node maps the next character to the child node, the "" key marks the end of a word.
+NUMBER_WORDS_TRIE: Dict[str, Any] = {}
+for _word in ALL_WORDS_SORTED_REVERSE:
+    _node = NUMBER_WORDS_TRIE
+    for _char in _word:
+        _node = _node.setdefault(_char, {})
+    _node[""] = _word
+
 
 class German(Language):
 
@@ -120,6 +129,8 @@ class German(Language):
         "achte": "acht"
     }
     LARGE_ORDINAL_SUFFIXES_GER = r"^(ster|stes|sten|ste)(\s|$)"  # RegEx for ord. > 19
+    # Same, to be matched at any position of a word
+    LARGE_ORDINAL_SUFFIXES_GER_RE = re.compile(LARGE_ORDINAL_SUFFIXES_GER[1:])
 
     MULTIPLIERS = MULTIPLIERS
     UNITS = UNITS
@@ -192,43 +203,53 @@ class German(Language):
         einhundertfünzig -> ein hundert fünfzig
         """
         text = word.lower()  # NOTE: if we want to use this outside it should keep case
-        invalid_word = ""
-        result = ""
-        while len(text) > 0:
-            # start with the longest
-            found = False
-            for sw, int_num in ALL_WORDS_SORTED_REVERSE.items():
-                # Check at the beginning of the current sentence for the longest word in ALL_WORDS
-                if text.startswith(sw):
-                    if len(invalid_word) > 0:
-                        result += invalid_word + " "
-                        invalid_word = ""
-                    result += sw + " "
-                    text = text[len(sw):]
-                    found = True
+        text_len = len(text)
+        result: List[str] = []
+        result_len = 0  # length of the space separated result so far
+        invalid_start = -1  # start of the current sequence of unknown characters
+        pos = 0
+        while pos < text_len:
+            # Look for the longest number word at the current position
+            node = NUMBER_WORDS_TRIE
+            match_end = 0
+            end = pos
+            while end < text_len:
+                child = node.get(text[end])
+                if child is None:
                     break
+                node = child
+                end += 1
+                if "" in node:
+                    match_end = end
+            if match_end:
+                if invalid_start >= 0:
+                    result.append(text[invalid_start:pos])
+                    result_len += pos - invalid_start + 1
+                    invalid_start = -1
+                result.append(text[pos:match_end])
+                result_len += match_end - pos + 1
+                pos = match_end
+                continue
             # current beginning could not be assigned to a word:
-            if not found:
-                # is (large) ordinal ending?
-                ord_match = None
-                if not invalid_word and len(result) > 3 and text.startswith("ste"):
-                    ord_match = re.search(self.LARGE_ORDINAL_SUFFIXES_GER, text)
-
-                if ord_match:
-                    # add ordinal ending
-                    end = ord_match.span()[1]
-                    # result = result[:-1] + text[start:end]   # drop last space and add suffix
-                    text = text[end:]
-                    invalid_word = ""
-                elif not text[0] == " ":
-                    # move one index
-                    invalid_word += text[0:1]
-                    text = text[1:]
-                else:
-                    if len(invalid_word) > 0:
-                        result += invalid_word + " "
-                        invalid_word = ""
-                    text = text[1:]
-        if len(invalid_word) > 0:
-            result += invalid_word + " "
-        return result
+            # is (large) ordinal ending?
+            ord_match = None
+            if invalid_start < 0 and result_len > 3 and text.startswith("ste", pos):
+                ord_match = self.LARGE_ORDINAL_SUFFIXES_GER_RE.match(text, pos)
+
+            if ord_match:
+                # drop ordinal ending
+                pos = ord_match.end()
+            elif text[pos] != " ":
+                # move one index
+                if invalid_start < 0:
+                    invalid_start = pos
+                pos += 1
+            else:
+                if invalid_start >= 0:
+                    result.append(text[invalid_start:pos])
+                    result_len += pos - invalid_start + 1
+                    invalid_start = -1
+                pos += 1
+        if invalid_start >= 0:
+            result.append(text[invalid_start:])
+        return "".join(part + " " for part in result)
@@ -23,9 +23,24 @@
 Convert spelled numbers into numeric values or digit strings.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Type
+from weakref import WeakKeyDictionary
 
 from text_to_num.lang import Language
+from text_to_num.lang.base import (
+    IS_DECIMAL_SEP,
+    IS_HUNDRED,
+    IS_MHUNDRED,
+    IS_MTEN,
+    IS_MTEN_WSTEN,
+    IS_MULTIPLIER,
+    IS_NUMBER,
+    IS_SIGN,
+    IS_STEN,
+    IS_UNIT,
+    IS_ZERO,
+    UNKNOWN_WORD,
+)
 from text_to_num.lang.german import German  # TODO: optimize and remove
 
 
@@ -74,12 +89,14 @@ class WordStreamValueParser(WordStreamValueParserInterface):
         ``lang.RELAXED`` as single numbers.
         """
         super().__init__(lang, relaxed)
+        self.lexicon = lang.lexicon
         self.skip: Optional[str] = None
         self.n000_val: int = 0  # the number value part > 1000
         self.grp_val: int = 0  # the current three digit group value
         self.last_word: Optional[
             str
         ] = None  # the last valid word for the current group
+        self.last_flags: int = 0  # the word classes of ``self.last_word``
 
     @property
     def value(self) -> int:
@@ -90,29 +107,35 @@ class WordStreamValueParser(WordStreamValueParserInterface):
         """Does the current group expect ``word`` to complete it as a valid number?
         ``word`` should not be a multiplier; multiplier should be handled first.
         """
+        return self._group_expects(word, self.lexicon.get(word, UNKNOWN_WORD).flags, update)
+
+    def _group_expects(self, word: str, flags: int, update: bool = True) -> bool:
+        """Same as ``self.group_expects`` with the word classes of ``word`` already known."""
         expected = False
+        last_flags = self.last_flags
         if self.last_word is None:
             expected = True
         elif (
-            self.last_word in self.lang.UNITS
+            last_flags & IS_UNIT
             and self.grp_val < 10
-            or self.last_word in self.lang.STENS
+            or last_flags & IS_STEN
             and self.grp_val < 20
         ):
-            expected = word in self.lang.HUNDRED
-        elif self.last_word in self.lang.MHUNDREDS:
+            expected = bool(flags & IS_HUNDRED)
+        elif last_flags & IS_MHUNDRED:
             expected = True
-        elif self.last_word in self.lang.MTENS:
-            expected = (
-                word in self.lang.UNITS
-                or word in self.lang.STENS
-                and self.last_word in self.lang.MTENS_WSTENS
+        elif last_flags & IS_MTEN:
+            expected = bool(
+                flags & IS_UNIT
+                or flags & IS_STEN
+                and last_flags & IS_MTEN_WSTEN
             )
-        elif self.last_word in self.lang.HUNDRED:
-            expected = word not in self.lang.HUNDRED
+        elif last_flags & IS_HUNDRED:
+            expected = not flags & IS_HUNDRED
 
         if update:
             self.last_word = word
+            self.last_flags = flags
         return expected
 
     def is_coef_appliable(self, coef: int) -> bool:
@@ -164,13 +187,14 @@ class WordStreamValueParser(WordStreamValueParserInterface):
             return True
 
         word = self.lang.normalize(word)
-        if word not in self.lang.NUMBERS:
+        flags, word_val = self.lexicon.get(word, UNKNOWN_WORD)
+        if not flags & IS_NUMBER:
             return False
 
         RELAXED = self.lang.RELAXED
 
-        if word in self.lang.MULTIPLIERS:
-            coef = self.lang.MULTIPLIERS[word]
+        if flags & IS_MULTIPLIER:
+            coef = word_val
             if not self.is_coef_appliable(coef):
                 return False
             # a multiplier can not be applied to a value bigger than itself,
@@ -184,6 +208,7 @@ class WordStreamValueParser(WordStreamValueParserInterface):
 
             self.grp_val = 0
             self.last_word = None
+            self.last_flags = 0
         elif (
             self.relaxed
             and word in RELAXED
@@ -195,21 +220,96 @@ class WordStreamValueParser(WordStreamValueParserInterface):
             self.grp_val += self.lang.NUMBERS[RELAXED[word][1]]
         elif self.skip and word.startswith(self.skip):
             self.skip = None
-        elif self.group_expects(word):
-            if word in self.lang.HUNDRED:
+        elif self._group_expects(word, flags):
+            if flags & IS_HUNDRED:
                 self.grp_val = (
-                    100 * self.grp_val if self.grp_val else self.lang.HUNDRED[word]
+                    100 * self.grp_val if self.grp_val else word_val
                 )
-            elif word in self.lang.MHUNDREDS:
-                self.grp_val = self.lang.MHUNDREDS[word]
+            elif flags & IS_MHUNDRED:
+                self.grp_val = word_val
             else:
-                self.grp_val += self.lang.NUMBERS[word]
+                self.grp_val += word_val
         else:
             self.skip = None
             return False
         return True
 
 
+# The word classes the group rules depend on, and the thresholds on the current
+# group value they test. Together they make the states of the transition table.
+GROUP_CLASSES = IS_UNIT | IS_STEN | IS_MTEN | IS_MTEN_WSTEN | IS_HUNDRED | IS_MHUNDRED
+GROUP_SHIFT = 2  # lowest bit of ``GROUP_CLASSES``
+GROUP_KEYS = 64  # number of distinct ``GROUP_CLASSES`` combinations
+GRP_VAL_BOUNDS = (0, 10, 20)  # a representative group value for each bucket
+
+_TRANSITION_TABLES: "WeakKeyDictionary[Language, Tuple[bool, ...]]" = WeakKeyDictionary()
+
+
+def compile_transition_table(lang: Language) -> Tuple[bool, ...]:
+    """Compile the group rules of ``WordStreamValueParser`` for the words of ``lang``.
+
+    The state of a group is the classes of its last word together with the bucket of
+    its current value (below 10, below 20, above). The table tells, for each state
+    and each class of incoming word, whether the word is expected. It is indexed by
+    ``(last_key * len(GRP_VAL_BOUNDS) + bucket) * GROUP_KEYS + word_key``.
+
+    Only the class combinations found in ``lang.lexicon`` are computed, all others
+    (which can't be reached) reject.
+    """
+    keys = {0} | {
+        (info.flags & GROUP_CLASSES) >> GROUP_SHIFT for info in lang.lexicon.values()
+    }
+    probe = WordStreamValueParser(lang)
+    probe.last_word = ""
+    table = [False] * (GROUP_KEYS * len(GRP_VAL_BOUNDS) * GROUP_KEYS)
+    for last_key in keys:
+        probe.last_flags = last_key << GROUP_SHIFT
+        for bucket, grp_val in enumerate(GRP_VAL_BOUNDS):
+            probe.grp_val = grp_val
+            row = (last_key * len(GRP_VAL_BOUNDS) + bucket) * GROUP_KEYS
+            for word_key in keys:
+                table[row + word_key] = probe._group_expects(
+                    "", word_key << GROUP_SHIFT, update=False
+                )
+    return tuple(table)
+
+
+class WordStreamValueParserFSM(WordStreamValueParser):
+    """Table-driven variant of ``WordStreamValueParser``.
+
+    The group rules are compiled once per language into a transition table
+    (see ``compile_transition_table``) and each word is checked with a single lookup.
+    It builds exactly the same values as ``WordStreamValueParser``.
+    """
+
+    def __init__(self, lang: Language, relaxed: bool = False) -> None:
+        super().__init__(lang, relaxed)
+        table = _TRANSITION_TABLES.get(lang)
+        if table is None:
+            table = _TRANSITION_TABLES[lang] = compile_transition_table(lang)
+        self.table = table
+
+    def _group_expects(self, word: str, flags: int, update: bool = True) -> bool:
+        if self.last_word is None:
+            expected = True
+        else:
+            grp_val = self.grp_val
+            bucket = 0 if grp_val < 10 else 1 if grp_val < 20 else 2
+            state = ((self.last_flags & GROUP_CLASSES) >> GROUP_SHIFT) * 3 + bucket
+            expected = self.table[state * GROUP_KEYS + ((flags & GROUP_CLASSES) >> GROUP_SHIFT)]
+        if update:
+            self.last_word = word
+            self.last_flags = flags
+        return expected
+
+
+# Value engines available to ``WordToDigitParser`` and the high-level API.
+ENGINES: Dict[str, Type[WordStreamValueParser]] = {
+    "rules": WordStreamValueParser,
+    "table": WordStreamValueParserFSM,
+}
+
+
 class WordStreamValueParserGerman(WordStreamValueParserInterface):
     """The actual value builder engine for the German language.
 
@@ -219,9 +319,14 @@ class WordStreamValueParserGerman(WordStreamValueParserInterface):
     digits by group of three to more easily speak them out.
     And indeed, the language uses powers of 1000 to structure big numbers.
 
+    Words are split into number words (hundertfünfzig -> hundert fünfzig) as they are
+    pushed and the number groups are closed at each multiplier, so that only the
+    current (open) group has to be evaluated again when a new word comes in.
+
     Public API:
 
-        - ``self.parse(word)``
+        - ``self.push(word, look_ahead)``
+        - ``self.parse(text)``
         - ``self.value: int``
     """
 
@@ -233,288 +338,301 @@ class WordStreamValueParserGerman(WordStreamValueParserInterface):
         """
         super().__init__(lang, relaxed)
         self.val: int = 0
+        self.n000_val: int = 0  # the value of the closed number groups
+        self.n000_results: int = 0  # the number of sub-results of the closed groups
+        self.last_multiplier: Optional[int] = None
+        self.num_block: List[str] = []  # the words of the current (open) number group
+        self.block_valid: bool = True  # is the current group a valid number?
+        self.failed: bool = False  # an invalid word or group was pushed: no way back
 
     @property
     def value(self) -> int:
         """At any moment, get the value of the currently recognized number."""
         return self.val
 
+    def push(self, word: str, look_ahead: Optional[str] = None) -> bool:
+        """Push next word from the stream.
+
+        Return ``True`` if all the words pushed so far form a valid number, else ``False``.
+        You can get the value of the number from ``self.value``.
+
+        Contrary to the common engine, a rejected word is not forgotten: the number may
+        become valid again with the next word, e.g. "zwei und" is rejected but
+        "zwei und zwanzig" is valid. To parse a new number, you need to instanciate a new
+        engine.
+
+        ``look_ahead`` is not used for now but is accepted for consistency with the common
+        engine.
+        """
+        if not word or self.failed:
+            return False
+
+        lexicon = self.lang.lexicon
+        for w in self.lang.split_number_word(word).split():
+            flags, multiplier = lexicon.get(w, UNKNOWN_WORD)
+            # Interrupt if there is any other word (no number, no AND)
+            if not flags & (IS_NUMBER | IS_ZERO) and w != self.lang.AND:
+                self.failed = True
+                return False
+
+            self.num_block.append(w)
+            if flags & IS_MULTIPLIER:
+                # check for multiplier errors (avoid numbers like "tausend einhundert zwei tausend)
+                if self.last_multiplier is None:
+                    self.last_multiplier = multiplier
+                elif multiplier >= self.last_multiplier:
+                    self.failed = True
+                    return False
+
+                # Close the group
+                try:
+                    group_val, n_results = self._parse_group(self.num_block, self.n000_results)
+                except ValueError:
+                    self.failed = True
+                    return False
+                self.n000_val += group_val
+                self.n000_results += n_results
+                self.num_block.clear()
+
+        group_val = 0
+        self.block_valid = True
+        if self.num_block:
+            try:
+                group_val, _ = self._parse_group(self.num_block, self.n000_results)
+            except ValueError:
+                self.block_valid = False
+                return False
+        self.val = self.n000_val + group_val
+        return True
+
     def parse(self, text: str) -> bool:
         """Check text for number words, split complex number words (hundertfünfzig)
         if necessary and parse all at once.
         """
         # Correct way of writing German numbers is one single word only if < 1 Mio.
-        # We need to split to be able to parse the text:
-        text = self.lang.split_number_word(text)
-        # print("split text:", text) # for debugging
+        # We need to split to be able to parse the text (see ``self.push``).
+        for word in text.split():
+            self.push(word)
+        if self.failed or not self.block_valid:
+            raise ValueError("invalid literal for text2num: {}".format(repr(text)))
+        return True
 
-        STATIC_HUNDRED = "hundert"
+    def _parse_group(self, num_group: List[str], n_results: int) -> Tuple[int, int]:
+        """Compute the value of a number group: the words up to a multiplier, included.
+
+        ``n_results`` is the number of sub-results found in the previous groups.
+
+        Return the value and the number of sub-results of the group.
+        Raise a ValueError if the group is not a valid number.
 
-        # Split text at MULTIPLIERS into 'num_groups'
-        # E.g.: 53.243.724 -> drei und fünfzig Millionen
-        # | zwei hundert drei und vierzig tausend | sieben hundert vier und zwanzig
+        E.g.: 53.243.724 -> drei und fünfzig Millionen
+        | zwei hundert drei und vierzig tausend | sieben hundert vier und zwanzig
+        """
+        STATIC_HUNDRED = "hundert"
 
-        num_groups = []
-        num_block = []
-        text = text.lower()
-        words = text.split()
-        last_multiplier = None
+        ng = num_group.copy()
+        group_val = 0
         equation_results = []
+        processed_a_part = False
+
+        # A sign at the beginning applies to the first part only
+        sign_at_beginning = False
+        negative = False
+        if (len(ng) > 0) and (ng[0] in self.lang.SIGN):
+            negative = self.lang.SIGN[ng[0]] == "-"
+            ng.pop(0)
+            equation_results.append(0)
+            sign_at_beginning = True
+
+        if sign_at_beginning and (
+            (len(ng) == 0)
+            or ((len(ng) > 0) and not ng[0] in German.NUMBER_DICT_GER)
+        ):
+            raise ValueError(
+                "invalid literal for text2num: {}".format(repr(num_group))
+            )
 
-        for w in words:
-            num_block.append(w)
-            if w in self.lang.MULTIPLIERS:
-                num_groups.append(num_block.copy())
-                num_block.clear()
+        # prozess zero(s) at the beginning
+        null_at_beginning = False
+        while (len(ng) > 0) and (ng[0] in self.lang.ZERO):
+            ng.pop(0)
+            equation_results.append(0)
+            processed_a_part = True
+            null_at_beginning = True
 
-                # check for multiplier errors (avoid numbers like "tausend einhundert zwei tausend)
-                if last_multiplier is None:
-                    last_multiplier = German.NUMBER_DICT_GER[w]
-                else:
-                    current_multiplier = German.NUMBER_DICT_GER[w]
-                    if (
-                        current_multiplier == last_multiplier
-                        or current_multiplier > last_multiplier
-                    ):
-                        raise ValueError(
-                            "invalid literal for text2num: {}".format(repr(w))
-                        )
-
-            # Also interrupt if there is any other word (no number, no AND)
-            if w not in German.NUMBER_DICT_GER and w != self.lang.AND:
-                raise ValueError("invalid literal for text2num: {}".format(repr(w)))
-
-        if len(num_block) > 0:
-            num_groups.append(num_block.copy())
-            num_block.clear()
-
-        main_equation = "0"
-        ng = None
-
-        while len(num_groups) > 0:
-            if ng is None:
-                ng = num_groups[0].copy()
-            equation = ""
-            processed_a_part = False
-
-            sign_at_beginning = False
-            if (len(ng) > 0) and (ng[0] in self.lang.SIGN):
-                equation += self.lang.SIGN[ng[0]]
-                ng.pop(0)
-                equation_results.append(0)
-                sign_at_beginning = True
-
-            if sign_at_beginning and (
-                (len(ng) == 0)
-                or ((len(ng) > 0) and not ng[0] in German.NUMBER_DICT_GER)
-            ):
-                raise ValueError(
-                    "invalid literal for text2num: {}".format(repr(num_groups))
-                )
+        if (
+            null_at_beginning
+            and (len(ng) > 0)
+            and (not ng[0] == self.lang.DECIMAL_SYM)
+        ):
+            raise ValueError(
+                "invalid literal for text2num: {}".format(repr(num_group))
+            )
 
-            # prozess zero(s) at the beginning
-            null_at_beginning = False
-            while (len(ng) > 0) and (ng[0] in self.lang.ZERO):
-                equation += "0"
-                ng.pop(0)
-                equation_results.append(0)
+        # Process "hundert" groups first
+        if STATIC_HUNDRED in ng:
+
+            hundred_index = ng.index(STATIC_HUNDRED)
+            if hundred_index == 0:
+                group_val += -100 if negative else 100
+                equation_results.append(100)
+                ng.pop(hundred_index)
                 processed_a_part = True
-                null_at_beginning = True
 
-            if (
-                null_at_beginning
-                and (len(ng) > 0)
-                and (not ng[0] == self.lang.DECIMAL_SYM)
+            elif (ng[hundred_index - 1] in self.lang.UNITS) or (
+                ng[hundred_index - 1] in self.lang.STENS
             ):
+                if hundred_index - 2 >= 0 and ng[hundred_index - 2] not in self.lang.MULTIPLIERS:
+                    raise ValueError("invalid {} without multiplier: {}".format(STATIC_HUNDRED, repr(ng)))
+                multiplier = German.NUMBER_DICT_GER[ng[hundred_index - 1]]
+                group_val += -multiplier * 100 if negative else multiplier * 100
+                equation_results.append(multiplier * 100)
+                ng.pop(hundred_index)
+                ng.pop(hundred_index - 1)
+                processed_a_part = True
+
+        # Process "und" groups
+        if self.lang.AND in ng and len(ng) >= 3:
+            and_index = ng.index(self.lang.AND)
+
+            # what if "und" comes at the end or beginnig?
+            if and_index + 1 >= len(ng) or and_index == 0:
                 raise ValueError(
-                    "invalid literal for text2num: {}".format(repr(num_groups))
+                    "invalid 'and' index for text2num: {}".format(repr(ng))
                 )
 
-            # Process "hundert" groups first
-            if STATIC_HUNDRED in ng:
+            # get the number before and after the "und"
+            first_summand = ng[and_index - 1]
+            second_summand = ng[and_index + 1]
 
-                hundred_index = ng.index(STATIC_HUNDRED)
-                if hundred_index == 0:
-                    if equation == "":
-                        equation = "100 "
-                    else:
-                        equation += " + 100 "
-                    equation_results.append(100)
-                    ng.pop(hundred_index)
-                    processed_a_part = True
-
-                elif (ng[hundred_index - 1] in self.lang.UNITS) or (
-                    ng[hundred_index - 1] in self.lang.STENS
-                ):
-                    if hundred_index - 2 >= 0 and ng[hundred_index - 2] not in self.lang.MULTIPLIERS:
-                        raise ValueError("invalid {} without multiplier: {}".format(STATIC_HUNDRED, repr(ng)))
-                    multiplier = German.NUMBER_DICT_GER[ng[hundred_index - 1]]
-                    equation += "(" + str(multiplier) + " * 100)"
-                    equation_results.append(multiplier * 100)
-                    ng.pop(hundred_index)
-                    ng.pop(hundred_index - 1)
-                    processed_a_part = True
-
-            # Process "und" groups
-            if self.lang.AND in ng and len(ng) >= 3:
-                and_index = ng.index(self.lang.AND)
-
-                # what if "und" comes at the end or beginnig?
-                if and_index + 1 >= len(ng) or and_index == 0:
-                    raise ValueError(
-                        "invalid 'and' index for text2num: {}".format(repr(ng))
-                    )
-
-                # get the number before and after the "und"
-                first_summand = ng[and_index - 1]
-                second_summand = ng[and_index + 1]
-
-                # string to num for atomic numbers
-                first_summand_num = German.NUMBER_DICT_GER[first_summand]
-                second_summand_num = German.NUMBER_DICT_GER[second_summand]
-
-                # not all combinations are allowed
-                if (
-                    first_summand_num >= 10
-                    or second_summand_num < 20
-                    or first_summand in German.NEVER_CONNECTS_WITH_AND
-                ):
-                    raise ValueError(
-                        "invalid 'and' group for text2num: {}".format(repr(ng))
-                    )
-
-                and_sum_eq = "(" + str(first_summand_num) + " + " + str(second_summand_num) + ")"
-                # Is there already a hundreds value in the equation?
-                if equation == "":
-                    equation += and_sum_eq
-                else:
-                    equation = "(" + equation + " + " + and_sum_eq + ")"
-                equation_results.append(first_summand_num + second_summand_num)
-                ng.pop(and_index + 1)
-                ng.pop(and_index)
-                ng.pop(and_index - 1)
-                processed_a_part = True
+            # "und und"
+            if first_summand == self.lang.AND or second_summand == self.lang.AND:
+                raise ValueError(
+                    "invalid 'and' group for text2num: {}".format(repr(ng))
+                )
 
-            # MTENS (20, 30, 40 .. 90)
-            elif any(x in ng for x in self.lang.MTENS):
+            # string to num for atomic numbers
+            first_summand_num = German.NUMBER_DICT_GER[first_summand]
+            second_summand_num = German.NUMBER_DICT_GER[second_summand]
 
-                # expect exactly one - TODO: ??! O_o who can read this?
-                mtens_res = [x for x in ng if x in self.lang.MTENS]
-                if not len(mtens_res) == 1:
-                    raise ValueError(
-                        "invalid literal for text2num: {}".format(repr(ng))
-                    )
+            # not all combinations are allowed
+            if (
+                first_summand_num >= 10
+                or second_summand_num < 20
+                or first_summand in German.NEVER_CONNECTS_WITH_AND
+            ):
+                raise ValueError(
+                    "invalid 'and' group for text2num: {}".format(repr(ng))
+                )
 
-                mtens_num = German.NUMBER_DICT_GER[mtens_res[0]]
-                if equation == "":
-                    equation += "(" + str(mtens_num) + ")"
-                else:
-                    equation = "(" + equation + " + (" + str(mtens_num) + "))"
-                mtens_index = ng.index(mtens_res[0])
-                equation_results.append(mtens_num)
-                ng.pop(mtens_index)
-                processed_a_part = True
+            and_sum = first_summand_num + second_summand_num
+            # Is there already a hundreds value?
+            group_val += -and_sum if negative and not processed_a_part else and_sum
+            equation_results.append(and_sum)
+            ng.pop(and_index + 1)
+            ng.pop(and_index)
+            ng.pop(and_index - 1)
+            processed_a_part = True
+
+        # MTENS (20, 30, 40 .. 90)
+        elif any(x in ng for x in self.lang.MTENS):
+
+            # expect exactly one - TODO: ??! O_o who can read this?
+            mtens_res = [x for x in ng if x in self.lang.MTENS]
+            if not len(mtens_res) == 1:
+                raise ValueError(
+                    "invalid literal for text2num: {}".format(repr(ng))
+                )
 
-            # 11, 12, 13, ... 19
-            elif any(x in ng for x in self.lang.STENS):
+            mtens_num = German.NUMBER_DICT_GER[mtens_res[0]]
+            group_val += -mtens_num if negative and not processed_a_part else mtens_num
+            mtens_index = ng.index(mtens_res[0])
+            equation_results.append(mtens_num)
+            ng.pop(mtens_index)
+            processed_a_part = True
 
-                # expect exactly one
-                stens_res = [x for x in ng if x in self.lang.STENS]
-                if not len(stens_res) == 1:
-                    raise ValueError(
-                        "invalid literal for text2num: {}".format(repr(ng))
-                    )
+        # 11, 12, 13, ... 19
+        elif any(x in ng for x in self.lang.STENS):
 
-                stens_num = German.NUMBER_DICT_GER[stens_res[0]]
-                if equation == "":
-                    equation += "(" + str(stens_num) + ")"
-                else:
-                    equation = "(" + equation + " + (" + str(stens_num) + "))"
-                stens_index = ng.index(stens_res[0])
-                equation_results.append(stens_num)
-                ng.pop(stens_index)
-                processed_a_part = True
+            # expect exactly one
+            stens_res = [x for x in ng if x in self.lang.STENS]
+            if not len(stens_res) == 1:
+                raise ValueError(
+                    "invalid literal for text2num: {}".format(repr(ng))
+                )
+
+            stens_num = German.NUMBER_DICT_GER[stens_res[0]]
+            group_val += -stens_num if negative and not processed_a_part else stens_num
+            stens_index = ng.index(stens_res[0])
+            equation_results.append(stens_num)
+            ng.pop(stens_index)
+            processed_a_part = True
 
-            # 1, 2, ... 9
-            elif any(x in ng for x in self.lang.UNITS):
+        # 1, 2, ... 9
+        elif any(x in ng for x in self.lang.UNITS):
 
-                # expect exactly one
-                units_res = [x for x in ng if x in self.lang.UNITS]
-                if not len(units_res) == 1:
-                    raise ValueError(
-                        "invalid literal for text2num: {}".format(repr(ng))
-                    )
+            # expect exactly one
+            units_res = [x for x in ng if x in self.lang.UNITS]
+            if not len(units_res) == 1:
+                raise ValueError(
+                    "invalid literal for text2num: {}".format(repr(ng))
+                )
 
-                units_num = German.NUMBER_DICT_GER[units_res[0]]
-                if equation == "":
-                    equation += "(" + str(units_num) + ")"
+            units_num = German.NUMBER_DICT_GER[units_res[0]]
+            group_val += -units_num if negative and not processed_a_part else units_num
+            units_index = ng.index(units_res[0])
+            equation_results.append(units_num)
+            ng.pop(units_index)
+            processed_a_part = True
+
+        # Add multipliers
+        if any(x in ng for x in self.lang.MULTIPLIERS):
+            # Multiplier is always the last word
+            if ng[len(ng) - 1] in self.lang.MULTIPLIERS:
+                multiplier = German.NUMBER_DICT_GER[ng[len(ng) - 1]]
+                if len(ng) > 1:
+                    # before last has to be UNITS, STENS or MTENS and cannot follow prev. num.
+                    if n_results + len(equation_results) > 0:
+                        # This prevents things like "zwei zweitausend" (DE) to become 4000
+                        raise ValueError("invalid literal for text2num: {}".format(repr(ng)))
+                    factor = German.NUMBER_DICT_GER.get(ng[len(ng) - 2])
+                    if factor and factor >= 1 and factor <= 90:
+                        group_val = factor * multiplier
+                        equation_results.append(factor * multiplier)
+                        ng.pop(len(ng) - 1)
+                        processed_a_part = True
+                    else:
+                        # I think we should fail here instead of ignore?
+                        raise ValueError("invalid literal for text2num: {}".format(repr(ng)))
                 else:
-                    equation = "(" + equation + " + (" + str(units_num) + "))"
-                units_index = ng.index(units_res[0])
-                equation_results.append(units_num)
-                ng.pop(units_index)
+                    if processed_a_part:
+                        group_val *= multiplier
+                    elif sign_at_beginning:
+                        raise ValueError("invalid literal for text2num: {}".format(repr(num_group)))
+                    else:
+                        group_val = multiplier
+                    equation_results.append(multiplier)
+                ng.pop(len(ng) - 1)
                 processed_a_part = True
 
-            # Add multipliers
-            if any(x in ng for x in self.lang.MULTIPLIERS):
-                # Multiplier is always the last word
-                if ng[len(ng) - 1] in self.lang.MULTIPLIERS:
-                    multiplier = German.NUMBER_DICT_GER[ng[len(ng) - 1]]
-                    if len(ng) > 1:
-                        # before last has to be UNITS, STENS or MTENS and cannot follow prev. num.
-                        factor = German.NUMBER_DICT_GER[ng[len(ng) - 2]]
-                        if len(equation_results) > 0:
-                            # This prevents things like "zwei zweitausend" (DE) to become 4000
-                            raise ValueError("invalid literal for text2num: {}".format(repr(ng)))
-                        if factor and factor >= 1 and factor <= 90:
-                            multiply_eq = "(" + str(factor) + " * " + str(multiplier) + ")"
-                            if equation == "":
-                                equation += multiply_eq
-                            else:
-                                equation += (" * " + multiply_eq)
-                            equation_results.append(factor * multiplier)
-                            ng.pop(len(ng) - 1)
-                            processed_a_part = True
-                        else:
-                            # I think we should fail here instead of ignore?
-                            raise ValueError("invalid literal for text2num: {}".format(repr(ng)))
-                    else:
-                        multiply_eq = "(" + str(multiplier) + ")"
-                        if equation == "":
-                            equation += multiply_eq
-                        else:
-                            equation += " * " + multiply_eq
-                        equation_results.append(multiplier)
-                    ng.pop(len(ng) - 1)
-                    processed_a_part = True
-
-            if not processed_a_part:
-                raise ValueError("invalid literal for text2num: {}".format(repr(ng)))
-
-            # done, remove number group
-            if len(ng) == 0:
-                num_groups.pop(0)
-                if len(num_groups) > 0:
-                    ng = num_groups[0].copy()
-            else:
-                # at this point there should not be any more number parts
-                raise ValueError(
-                    "invalid literal for text2num - group {} in {}".format(repr(num_groups), text)
-                )
+        if not processed_a_part:
+            raise ValueError("invalid literal for text2num: {}".format(repr(ng)))
 
-            # Any sub-equation that results to 0 and is not the first sub-equation means an error
-            if (
-                len(equation_results) > 1
-                and equation_results[len(equation_results) - 1] == 0
-            ):
-                raise ValueError("invalid literal for text2num: {}".format(repr(text)))
+        # at this point there should not be any more number parts
+        if len(ng) > 0:
+            raise ValueError(
+                "invalid literal for text2num - group {}".format(repr(num_group))
+            )
 
-            main_equation = main_equation + " + (" + equation + ")"
-            # print("equation:", main_equation)  # for debugging
-            # print("equation_results", equation_results)  # for debugging
+        # Any sub-equation that results to 0 and is not the first sub-equation means an error
+        if (
+            n_results + len(equation_results) > 1
+            and equation_results[len(equation_results) - 1] == 0
+        ):
+            raise ValueError("invalid literal for text2num: {}".format(repr(num_group)))
 
-        self.val = eval(main_equation)  # TODO: use 'equation_results' instead
-        return True
+        # print("equation_results", equation_results)  # for debugging
+        return group_val, len(equation_results)
 
 
 class WordToDigitParser:
@@ -558,7 +676,8 @@ class WordToDigitParser:
         relaxed: bool = False,
         signed: bool = True,
         ordinal_threshold: int = 3,
-        preceding_word: Optional[str] = None
+        preceding_word: Optional[str] = None,
+        engine: str = "rules",
     ) -> None:
         """Initialize the parser.
 
@@ -569,11 +688,15 @@ class WordToDigitParser:
         « plus deux » (+2), or « moins vingt » (-20).
 
         Ordinals up to `ordinal_threshold` are not converted.
+
+        ``engine`` selects the value engine among ``ENGINES``.
         """
         self.lang = lang
+        self.lexicon = lang.lexicon
         self._value: List[str] = []
-        self.int_builder = WordStreamValueParser(lang, relaxed=relaxed)
-        self.frac_builder = WordStreamValueParser(lang, relaxed=relaxed)
+        builder = ENGINES[engine]
+        self.int_builder = builder(lang, relaxed=relaxed)
+        self.frac_builder = builder(lang, relaxed=relaxed)
         self.signed = signed
         self.in_frac = False
         self.closed = False  # For deferred stop
@@ -648,26 +771,29 @@ class WordToDigitParser:
             self.last_word = word
             return False
 
+        flags = self.lexicon.get(word, UNKNOWN_WORD).flags
+        # the look-ahead only matters for signs, zeros and decimal separators
+        ahead_flags = self.lexicon.get(look_ahead, UNKNOWN_WORD).flags if flags and look_ahead else 0
+
         if (
             self.signed
-            and word in self.lang.SIGN
-            and look_ahead in self.lang.NUMBERS
+            and flags & IS_SIGN
+            and ahead_flags & IS_NUMBER
             and self.at_start()
         ):
             self._value.append(self.lang.SIGN[word])
         elif (
-            word in self.lang.ZERO
+            flags & IS_ZERO
             and self.at_start_of_seq()
             and (
                 look_ahead is None
-                or look_ahead in self.lang.NUMBERS
-                or look_ahead in self.lang.ZERO
+                or ahead_flags & (IS_NUMBER | IS_ZERO)
                 or look_ahead in self.lang.DECIMAL_SEP
             )
         ):
             self._value.append("0")
         elif (
-            word in self.lang.ZERO
+            flags & IS_ZERO
             and self.at_start_of_seq()
             and look_ahead is not None
             and look_ahead in self.lang.DECIMAL_SEP
@@ -688,8 +814,8 @@ class WordToDigitParser:
             )
             self.closed = True
         elif (
-            (word == self.lang.DECIMAL_SEP or word in self.lang.DECIMAL_SEP.split(','))
-            and (look_ahead in self.lang.NUMBERS or look_ahead in self.lang.ZERO)
+            flags & IS_DECIMAL_SEP
+            and ahead_flags & (IS_NUMBER | IS_ZERO)
             and not self.in_frac
         ):
             if not self.value:
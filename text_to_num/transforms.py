@@ -26,8 +26,8 @@ from typing import Any, Iterator, List, Sequence, Tuple, Union, Optional
 
 from .lang import LANG, Language, German, Portuguese
 from .parsers import (
+    ENGINES,
     WordStreamValueParserInterface,
-    WordStreamValueParser,  # we should rename this to 'WordStreamValueParserCommon'
     WordStreamValueParserGerman,
     WordToDigitParser,
 )
@@ -57,16 +57,26 @@ def look_ahead(sequence: Sequence[Any]) -> Iterator[Tuple[Any, Any]]:
         yield val, ahead
 
 
-def text2num(text: str, lang: Union[str, Language], relaxed: bool = False) -> int:
+def text2num(
+    text: str,
+    lang: Union[str, Language],
+    relaxed: bool = False,
+    engine: str = "rules",
+) -> int:
     """Convert the ``text`` string containing an integer number written as letters
     into an integer value.
 
     Set ``relaxed`` to True if you want to accept "quatre vingt(s)" as "quatre-vingt"
     (fr) or "ein und zwanzig" as "einundzwanzig" (de) etc..
 
+    ``engine`` selects the value engine: "rules" (default) or "table", the
+    table-driven one. Both give the same results. It is ignored for German.
+
     Raises an ValueError if ``text`` does not describe a valid number.
     Return an int.
     """
+    if engine not in ENGINES:
+        raise ValueError("Unknown engine: {}".format(repr(engine)))
     language: Language
     # mypy seems unable to understand this
     language = LANG[lang] if type(lang) is str else lang  # type: ignore
@@ -82,7 +92,7 @@ def text2num(text: str, lang: Union[str, Language], relaxed: bool = False) -> in
         return num_parser.value
     # Default
     else:
-        num_parser = WordStreamValueParser(language, relaxed=relaxed)
+        num_parser = ENGINES[engine](language, relaxed=relaxed)
         tokens = list(dropwhile(lambda x: x in language.ZERO, text.split()))
         if not all(num_parser.push(word, ahead) for word, ahead in look_ahead(tokens)):
             raise ValueError("invalid literal for text2num: {}".format(repr(text)))
@@ -96,6 +106,7 @@ def alpha2digit(
     relaxed: bool = False,
     signed: bool = True,
     ordinal_threshold: int = 3,
+    engine: str = "rules",
 ) -> str:
     """Return the text of ``text`` with all the ``lang`` spelled numbers converted to digits.
     Takes care of punctuation.
@@ -104,9 +115,14 @@ def alpha2digit(
     if you prefer to get « minus 2 » instead of « -2 ».
 
     Ordinals up to `ordinal_threshold` are not converted.
+
+    ``engine`` selects the value engine: "rules" (default) or "table", the
+    table-driven one. Both give the same results. It is ignored for German.
     """
     if lang not in LANG:
         raise Exception("Language not supported")
+    if engine not in ENGINES:
+        raise ValueError("Unknown engine: {}".format(repr(engine)))
 
     language = LANG[lang]
     segments = WORD_SEP.split(text)
@@ -136,6 +152,7 @@ def alpha2digit(
                 relaxed=relaxed,
                 signed=signed,
                 ordinal_threshold=ordinal_threshold,
+                engine=engine,
             )
             last_word = None
             in_number = False
@@ -150,7 +167,8 @@ def alpha2digit(
                         relaxed=relaxed,
                         signed=signed,
                         ordinal_threshold=ordinal_threshold,
-                        preceding_word=last_word
+                        preceding_word=last_word,
+                        engine=engine,
                     )
                     in_number = num_builder.push(word, ahead and ahead.lower())
                 if not in_number:
@@ -208,6 +226,7 @@ def _alpha2digit_agg(
         current_token_ordinal_org = None
         reset_to_last_if_failed = False
         token_index = 0
+        num_parser = WordStreamValueParserGerman(language, relaxed=relaxed)
 
         while token_index < len(tokens):
             t = tokens[token_index]
@@ -219,11 +238,10 @@ def _alpha2digit_agg(
                 tmp_token_ordinal_org = t
                 t = cardinal_for_ordinal
             sentence.append(t)
-            try:
-                # TODO: this is very inefficient because we analyze the same text
-                # again and again until it fails including 'split_number_word' and all the
-                # heavy lifting ... but it works and is hard to optimize ¯\_(ツ)_/¯
-                num_result = text2num(" ".join(sentence), language, relaxed=relaxed)
+            # The parser keeps track of the words pushed so far, so each token
+            # is only analyzed once.
+            if num_parser.push(t):
+                num_result = num_parser.value
                 # TODO: here we need to use 'relaxed' to check how to continue
                 combined_num_result = num_result
                 current_token_ordinal_org = tmp_token_ordinal_org
@@ -239,7 +257,7 @@ def _alpha2digit_agg(
                     sentence[len(sentence)-1] = str(tmp_token_ordinal_org)
                     token_to_add = " ".join(sentence)
                     token_to_add_is_num = False
-            except ValueError:
+            else:
                 # This will happen if look-ahead was required (e.g. because of AND) but failed:
                 if reset_to_last_if_failed:
                     reset_to_last_if_failed = False
@@ -283,6 +301,7 @@ def _alpha2digit_agg(
                 out_tokens_is_num.append(token_to_add_is_num)
                 out_tokens_ordinal_org.append(current_token_ordinal_org)
                 sentence.clear()
+                num_parser = WordStreamValueParserGerman(language, relaxed=relaxed)
                 combined_num_result = None
                 current_token_ordinal_org = None
 